@@ -1,35 +1,87 @@
+import argparse
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime, timedelta, date
-import hashlib
 from decimal import Decimal, InvalidOperation
-from typing import Optional, Tuple, Dict, List
-import json
-from dataclasses import dataclass, asdict
+import hashlib
+import hmac
+from functools import lru_cache
+from collections import deque
+from typing import Optional, Tuple, Dict, Iterator
+from dataclasses import dataclass
 
 # Importing Rich for an enhanced user interface
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt
+from rich.text import Text
 
 console = Console()
 
+_WITHDRAWAL_MULTIPLE = 50000
+_DAILY_WITHDRAWAL_LIMIT = 5000000
+_DEFAULT_INTEREST_RATE = (1, 100)
+_HISTORY_MAXLEN = 1000
+_MAX_AMOUNT_DIGITS = 20
+
+# Transaction type keys used for daily totals and history records
+_WITHDRAWAL = sys.intern('withdrawal')
+_DEPOSIT = sys.intern('deposit')
+_TRANSFER = sys.intern('transfer')
+_INTEREST = sys.intern('interest')
+
+
+@lru_cache(maxsize=256)
+def _hash_password(password: str) -> bytes:
+    """Hash password using SHA-256 (unsalted; cached until the next logout or PIN change)"""
+    return hashlib.sha256(password.strip().encode()).digest()
+
 
-@dataclass
+def _parse_amount(amount) -> int:
+    """Convert an amount to whole rupiah, raising ValueError if it is not an integer"""
+    if isinstance(amount, bool):
+        raise ValueError(f"Invalid amount: {amount!r}")
+    if isinstance(amount, int):
+        return amount
+    if isinstance(amount, str):
+        try:
+            amount = Decimal(amount.strip().replace(',', ''))
+        except InvalidOperation as e:
+            raise ValueError(f"Invalid amount: {amount!r}") from e
+    # Refuse huge exponents such as '1e999999999' before int() expands them digit by digit
+    if isinstance(amount, Decimal) and amount.is_finite() and amount.adjusted() > _MAX_AMOUNT_DIGITS:
+        raise ValueError(f"Amount too large: {amount!r}")
+    # Numeric types such as Decimal or float are accepted when they hold a whole value
+    try:
+        int_amount = int(amount)
+    except (TypeError, OverflowError) as e:
+        raise ValueError(f"Invalid amount: {amount!r}") from e
+    if int_amount != amount:
+        raise ValueError(f"Amount is not a whole number: {amount!r}")
+    return int_amount
+
+
+@dataclass(slots=True, frozen=True)
 class Transaction:
     timestamp: datetime
     type: str
-    amount: Decimal
-    balance_after: Decimal
+    amount: int
+    balance_after: int
     recipient: Optional[str] = None
 
     def to_dict(self) -> dict:
-        data = asdict(self)
-        data["timestamp"] = self.timestamp.isoformat()
-        data["amount"] = str(self.amount)
-        data["balance_after"] = str(self.balance_after)
-        return data
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "type": self.type,
+            "amount": str(self.amount),
+            "balance_after": str(self.balance_after),
+            "recipient": self.recipient,
+        }
 
 
 class SecurityError(Exception):
@@ -37,75 +89,88 @@ class SecurityError(Exception):
     pass
 
 
+class FastRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that skips the filesystem checks while the log is below maxBytes"""
+
+    def shouldRollover(self, record):
+        if self.stream is not None and self.maxBytes > 0:
+            msg_len = len(self.format(record)) + 1
+            if self.stream.tell() + msg_len < self.maxBytes:
+                return False
+        return super().shouldRollover(record)
+
+
 class ATMSystem:
     def __init__(self, initial_data: list = None):
         """Initialize ATM system with user data and setup logging"""
         self.setup_logging()  # Setup the logger first
         # Initialize attributes required before loading data.
-        self.daily_totals: Dict[str, Dict[str, Dict[date, Decimal]]] = {}
-        self.accounts: Dict[str, Dict[str, Decimal or str]] = {}
+        self.daily_totals: Dict[str, Dict[str, Tuple[Optional[date], int]]] = {}
+        self.accounts: Dict[str, Dict[str, int or bytes]] = {}
         self._load_initial_data(initial_data)
-        self.transaction_history: Dict[str, List[Transaction]] = {}
-        self.failed_attempts: Dict[str, Tuple[int, datetime]] = {}
+        self.transaction_history: Dict[str, deque] = {}
+        self.failed_attempts: Dict[str, Tuple[int, float]] = {}
         self.session_active: bool = False
         self.current_user: Optional[str] = None
+        self._current_account: Optional[Dict[str, int or bytes]] = None
 
     def setup_logging(self):
-        """Configure logging system with a rotating file handler"""
+        """Configure logging system with a rotating file handler fed by a background queue listener"""
         self.logger = logging.getLogger("ATMSystem")
         self.logger.setLevel(logging.INFO)
-        handler = RotatingFileHandler("atm_transactions.log", maxBytes=5 * 1024 * 1024, backupCount=3)
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
         if not self.logger.handlers:
-            self.logger.addHandler(handler)
+            handler = FastRotatingFileHandler("atm_transactions.log", maxBytes=5 * 1024 * 1024, backupCount=3)
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            handler.setFormatter(formatter)
+            # File writes happen on the listener thread; stop() flushes pending records on exit
+            log_queue = queue.Queue(-1)
+            listener = QueueListener(log_queue, handler)
+            listener.start()
+            atexit.register(listener.stop)
+            self.logger.addHandler(QueueHandler(log_queue))
 
     def _load_initial_data(self, initial_data: list = None):
         """Load initial user data or create default data"""
         if initial_data is None:
             initial_data = [
-                ('ATA', self._hash_password('8830'), Decimal('100000')),
-                ('AISYAH', self._hash_password('8790'), Decimal('50000')),
-                ('EZRA DEBY', self._hash_password('9086'), Decimal('200000'))
+                ('ATA', _hash_password('8830'), 100000),
+                ('AISYAH', _hash_password('8790'), 50000),
+                ('EZRA DEBY', _hash_password('9086'), 200000)
             ]
         for username, pw_hash, saldo in initial_data:
-            key = username.strip().upper()
+            key = sys.intern(username.strip().upper())
             self.accounts[key] = {'password_hash': pw_hash, 'saldo': saldo}
             # Initialize daily totals for each account
-            self.daily_totals[key] = {'withdrawal': {}, 'deposit': {}, 'transfer': {}}
-
-    @staticmethod
-    def _hash_password(password: str) -> str:
-        """Hash password using SHA-256"""
-        return hashlib.sha256(password.strip().encode()).hexdigest()
+            self.daily_totals[key] = {_WITHDRAWAL: (None, 0), _DEPOSIT: (None, 0), _TRANSFER: (None, 0)}
 
     def authenticate(self, username: str, password: str) -> bool:
         """Authenticate user with retry limits and cooling period"""
-        username = username.strip().upper()
+        username = sys.intern(username.strip().upper())
 
         # Check for too many failed attempts (cooling period: 5 minutes)
         if username in self.failed_attempts:
             attempts, last_attempt = self.failed_attempts[username]
             if attempts >= 3:
-                time_diff = (datetime.now() - last_attempt).total_seconds()
+                time_diff = time.monotonic() - last_attempt
                 if time_diff < 300:
-                    self.logger.warning(f"Account {username} locked due to multiple failed attempts")
+                    self.logger.warning("Account %s locked due to multiple failed attempts", username)
                     console.print(f"[bold red]Account locked. Please try again in {int(5 - time_diff // 60)} minutes[/bold red]")
                     return False
                 else:
-                    self.failed_attempts[username] = (0, datetime.now())
+                    self.failed_attempts[username] = (0, time.monotonic())
 
         if username not in self.accounts:
-            self.logger.warning(f"Failed login attempt for non-existent user: {username}")
+            self.logger.warning("Failed login attempt for non-existent user: %s", username)
             console.print("[bold red]User not found.[/bold red]")
             return False
 
         stored_hash = self.accounts[username]['password_hash']
-        if self._hash_password(password) == stored_hash:
-            self.failed_attempts[username] = (0, datetime.now())
+        if hmac.compare_digest(_hash_password(password), stored_hash):
+            self.failed_attempts[username] = (0, time.monotonic())
             self.session_active = True
             self.current_user = username
-            self.logger.info(f"Successful login: {username}")
+            self._current_account = self.accounts[username]
+            self.logger.info("Successful login: %s", username)
             return True
         else:
             self._handle_failed_attempt(username)
@@ -116,9 +181,9 @@ class ATMSystem:
         if username in self.failed_attempts:
             attempts, _ = self.failed_attempts[username]
             attempts += 1
-            self.failed_attempts[username] = (attempts, datetime.now())
+            self.failed_attempts[username] = (attempts, time.monotonic())
         else:
-            self.failed_attempts[username] = (1, datetime.now())
+            self.failed_attempts[username] = (1, time.monotonic())
 
         attempts = self.failed_attempts[username][0]
         remaining = max(0, 3 - attempts)
@@ -128,104 +193,134 @@ class ATMSystem:
         if not self.session_active or self.current_user is None:
             raise SecurityError("No active session")
 
-    def check_balance(self) -> Decimal:
+    def check_balance(self) -> int:
         """Check account balance"""
         self._assert_session()
-        return self.accounts[self.current_user]['saldo']
+        return self._current_account['saldo']
 
-    def _update_daily_total(self, trans_type: str, amount: Decimal):
+    def _update_daily_total(self, trans_type: str, amount: int, today: Optional[date] = None):
         """Update the cached daily total for the current user and transaction type"""
-        today = date.today()
-        user_totals = self.daily_totals[self.current_user][trans_type]
-        user_totals[today] = user_totals.get(today, Decimal('0')) + amount
+        if today is None:
+            today = date.today()
+        user_totals = self.daily_totals[self.current_user]
+        day, total = user_totals[trans_type]
+        user_totals[trans_type] = (today, (total if day == today else 0) + amount)
 
-    def _get_daily_total(self, trans_type: str) -> Decimal:
+    def _get_daily_total(self, trans_type: str, today: Optional[date] = None) -> int:
         """Retrieve the daily total for the current user and transaction type"""
-        today = date.today()
-        return self.daily_totals[self.current_user][trans_type].get(today, Decimal('0'))
+        if today is None:
+            today = date.today()
+        day, total = self.daily_totals[self.current_user][trans_type]
+        return total if day == today else 0
 
     def _log_transaction(self, trans: Transaction):
         """Log transaction details and store it in history"""
-        if self.current_user not in self.transaction_history:
-            self.transaction_history[self.current_user] = []
-        self.transaction_history[self.current_user].append(trans)
-        self.logger.info(f"Transaction: {self.current_user} - {json.dumps(trans.to_dict())}")
+        history = self.transaction_history.get(self.current_user)
+        if history is None:
+            history = self.transaction_history[self.current_user] = deque(maxlen=_HISTORY_MAXLEN)
+        history.append(trans)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Transaction: %s - %s|%s|%s|%s|%s", self.current_user, trans.timestamp.isoformat(),
+                trans.type, trans.amount, trans.balance_after, trans.recipient or ''
+            )
+
+    def _debit(self, amount: int, today: date) -> Tuple[bool, str, int]:
+        """Validate and debit the current account, counting it against the daily withdrawal limit.
+
+        Returns (success, error message, balance after the debit).
+        """
+        account = self._current_account
+        current_balance = account['saldo']
 
-    def withdraw(self, amount: Decimal) -> Tuple[bool, str]:
+        if amount <= 0:
+            return False, "Amount must be positive", current_balance
+        if amount % _WITHDRAWAL_MULTIPLE != 0:
+            return False, "Amount must be in multiples of 50,000", current_balance
+        if amount > current_balance:
+            return False, "Insufficient funds", current_balance
+        if self._get_daily_total(_WITHDRAWAL, today) + amount > _DAILY_WITHDRAWAL_LIMIT:
+            return False, f"Daily withdrawal limit (Rp{_DAILY_WITHDRAWAL_LIMIT:,}) exceeded", current_balance
+
+        new_balance = current_balance - amount
+        account['saldo'] = new_balance
+        self._update_daily_total(_WITHDRAWAL, amount, today)
+        return True, "", new_balance
+
+    def withdraw(self, amount: int) -> Tuple[bool, str]:
         """Process withdrawal with validation and limits"""
         self._assert_session()
         try:
-            amount = Decimal(amount)
-        except (InvalidOperation, ValueError):
+            amount = _parse_amount(amount)
+        except ValueError:
             return False, "Invalid amount"
 
-        if amount <= 0:
-            return False, "Amount must be positive"
-        if amount % Decimal('50000') != 0:
-            return False, "Amount must be in multiples of 50,000"
-
-        current_balance = self.check_balance()
-        if amount > current_balance:
-            return False, "Insufficient funds"
-
-        daily_limit = Decimal('5000000')
-        if self._get_daily_total('withdrawal') + amount > daily_limit:
-            return False, f"Daily withdrawal limit (Rp{daily_limit:,}) exceeded"
+        now = datetime.now()
+        success, message, new_balance = self._debit(amount, now.date())
+        if not success:
+            return False, message
 
-        self.accounts[self.current_user]['saldo'] -= amount
-        self._update_daily_total('withdrawal', amount)
         trans = Transaction(
-            timestamp=datetime.now(),
-            type='withdrawal',
+            timestamp=now,
+            type=_WITHDRAWAL,
             amount=amount,
-            balance_after=self.check_balance()
+            balance_after=new_balance
         )
         self._log_transaction(trans)
         return True, f"Successfully withdrawn Rp{amount:,}"
 
-    def deposit(self, amount: Decimal) -> Tuple[bool, str]:
+    def deposit(self, amount: int) -> Tuple[bool, str]:
         """Process deposit with validation"""
         self._assert_session()
         try:
-            amount = Decimal(amount)
-        except (InvalidOperation, ValueError):
+            amount = _parse_amount(amount)
+        except ValueError:
             return False, "Invalid amount"
 
         if amount <= 0:
             return False, "Amount must be positive"
 
-        self.accounts[self.current_user]['saldo'] += amount
-        self._update_daily_total('deposit', amount)
+        now = datetime.now()
+        account = self._current_account
+        new_balance = account['saldo'] + amount
+        account['saldo'] = new_balance
+        self._update_daily_total(_DEPOSIT, amount, now.date())
         trans = Transaction(
-            timestamp=datetime.now(),
-            type='deposit',
+            timestamp=now,
+            type=_DEPOSIT,
             amount=amount,
-            balance_after=self.check_balance()
+            balance_after=new_balance
         )
         self._log_transaction(trans)
         return True, f"Successfully deposited Rp{amount:,}"
 
-    def transfer(self, recipient: str, amount: Decimal) -> Tuple[bool, str]:
+    def transfer(self, recipient: str, amount: int) -> Tuple[bool, str]:
         """Process transfer between accounts"""
         self._assert_session()
-        recipient = recipient.strip().upper()
+        recipient = sys.intern(recipient.strip().upper())
 
         if recipient not in self.accounts:
             return False, "Recipient account not found"
         if recipient == self.current_user:
             return False, "Cannot transfer to your own account"
+        try:
+            amount = _parse_amount(amount)
+        except ValueError:
+            return False, "Invalid amount"
 
-        success, message = self.withdraw(amount)
+        now = datetime.now()
+        today = now.date()
+        success, message, new_balance = self._debit(amount, today)
         if not success:
             return False, message
 
         self.accounts[recipient]['saldo'] += amount
-        self._update_daily_total('transfer', amount)
+        self._update_daily_total(_TRANSFER, amount, today)
         trans = Transaction(
-            timestamp=datetime.now(),
-            type='transfer',
+            timestamp=now,
+            type=_TRANSFER,
             amount=amount,
-            balance_after=self.check_balance(),
+            balance_after=new_balance,
             recipient=recipient
         )
         self._log_transaction(trans)
@@ -234,158 +329,237 @@ class ATMSystem:
     def change_pin(self, old_pin: str, new_pin: str) -> Tuple[bool, str]:
         """Allow the current user to change their PIN"""
         self._assert_session()
-        if self._hash_password(old_pin) != self.accounts[self.current_user]['password_hash']:
+        account = self._current_account
+        if not hmac.compare_digest(_hash_password(old_pin), account['password_hash']):
+            _hash_password.cache_clear()
             return False, "Incorrect old PIN"
-        self.accounts[self.current_user]['password_hash'] = self._hash_password(new_pin)
-        self.logger.info(f"User {self.current_user} changed PIN.")
+        account['password_hash'] = _hash_password(new_pin)
+        # Drop the old and new plaintext PINs held as cache keys
+        _hash_password.cache_clear()
+        self.logger.info("User %s changed PIN.", self.current_user)
         return True, "PIN successfully changed."
 
-    def simulate_interest(self, interest_rate: Decimal = Decimal("0.01")) -> Tuple[bool, str]:
-        """Simulate monthly interest accrual on the account balance"""
+    def simulate_interest(self, interest_rate: Tuple[int, int] = _DEFAULT_INTEREST_RATE) -> Tuple[bool, str]:
+        """Simulate monthly interest accrual; the rate is a (numerator, denominator) pair"""
         self._assert_session()
-        current_balance = self.check_balance()
-        interest = current_balance * interest_rate
-        self.accounts[self.current_user]['saldo'] += interest
+        account = self._current_account
+        current_balance = account['saldo']
+        num, den = interest_rate
+        interest = current_balance * num // den
+        new_balance = current_balance + interest
+        account['saldo'] = new_balance
         trans = Transaction(
             timestamp=datetime.now(),
-            type='interest',
+            type=_INTEREST,
             amount=interest,
-            balance_after=self.check_balance()
+            balance_after=new_balance
         )
         self._log_transaction(trans)
-        return True, f"Interest of Rp{interest:,.2f} applied. New balance: Rp{self.accounts[self.current_user]['saldo']:,.2f}"
+        return True, f"Interest of Rp{interest:,} applied. New balance: Rp{new_balance:,}"
 
-    def get_transaction_history(self) -> List[dict]:
-        """Get transaction history for current user as list of dictionaries"""
+    def get_transaction_history(self) -> Iterator[dict]:
+        """Lazily yield the current user's recent transactions as dictionaries.
+
+        Returns an iterator rather than a list, so it is always truthy; check for
+        emptiness by consuming it. It walks a snapshot of the history taken at call
+        time, so new transactions made while iterating are not included.
+        """
         self._assert_session()
-        return [trans.to_dict() for trans in self.transaction_history.get(self.current_user, [])]
+        history = tuple(self.transaction_history.get(self.current_user, ()))
+        return (trans.to_dict() for trans in history)
 
     def logout(self):
         """End user session"""
         if self.session_active:
-            self.logger.info(f"User logged out: {self.current_user}")
+            self.logger.info("User logged out: %s", self.current_user)
             self.session_active = False
             self.current_user = None
+            self._current_account = None
+            _hash_password.cache_clear()
+
+
+_MENU_OPTIONS = (
+    ("1", "Check Balance"),
+    ("2", "Withdraw"),
+    ("3", "Deposit"),
+    ("4", "Transfer"),
+    ("5", "Transaction History"),
+    ("6", "Change PIN"),
+    ("7", "Simulate Interest Accrual"),
+    ("8", "Logout"),
+    ("9", "Exit"),
+)
+
+
+def _new_history_table() -> Table:
+    """Create an empty transaction history table with its column layout"""
+    history_table = Table(title="Transaction History", show_header=True, header_style="bold magenta")
+    history_table.add_column("Type", style="cyan")
+    history_table.add_column("Amount", style="green")
+    history_table.add_column("Balance After", style="green")
+    history_table.add_column("Recipient", style="yellow")
+    history_table.add_column("Timestamp", style="white")
+    return history_table
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="Enhanced ATM System")
+    parser.add_argument("--fast", action="store_true",
+                        help="use plain input()/print() instead of Rich prompts and tables (for scripted runs)")
+    args = parser.parse_args(argv)
+
+    if args.fast:
+        def ask(prompt: str, password: bool = False) -> str:
+            return input(f"{prompt}: ").strip()
+
+        menu_text = "ATM Main Menu\n" + "\n".join(f"{option}. {operation}" for option, operation in _MENU_OPTIONS)
+
+        def show_menu():
+            print(menu_text)
+
+        def say(text: str, style: Optional[str] = None):
+            print(text)
+
+        def panel(text: str, style: Optional[str] = None):
+            print(text)
+    else:
+        def ask(prompt: str, password: bool = False) -> str:
+            return Prompt.ask(f"[bold yellow]{prompt}[/bold yellow]", password=password).strip()
+
+        # Build a modern menu using Rich's Table (once; it never changes)
+        menu_table = Table(title="ATM Main Menu", show_header=False, header_style="bold magenta")
+        menu_table.add_column("Option", justify="center", style="cyan", no_wrap=True)
+        menu_table.add_column("Operation", style="magenta")
+        for option, operation in _MENU_OPTIONS:
+            menu_table.add_row(option, operation)
+
+        def show_menu():
+            console.print(menu_table)
 
+        def say(text: str, style: Optional[str] = None):
+            console.print(text, style=style)
+
+        def panel(text: str, style: Optional[str] = None):
+            console.print(Panel(Text(text, style=style or ""), expand=False))
 
-def main():
     atm = ATMSystem()
-    console.print(Panel("[bold cyan]Welcome to the Enhanced ATM System[/bold cyan]", expand=False))
+    panel("Welcome to the Enhanced ATM System", "bold cyan")
     
     while True:
         if not atm.session_active:
-            username = Prompt.ask("[bold yellow]Enter username (or type 'exit' to quit)[/bold yellow]").strip()
+            try:
+                username = ask("Enter username (or type 'exit' to quit)")
+            except (EOFError, KeyboardInterrupt):
+                # Input ran out (e.g. end of a piped script) or the user pressed Ctrl+C
+                print()
+                say("Exiting... Goodbye!", "bold green")
+                break
             if username.lower() == 'exit':
-                console.print("[bold green]Exiting... Goodbye![/bold green]")
+                say("Exiting... Goodbye!", "bold green")
+                break
+            try:
+                password = ask("Enter PIN", password=True)
+            except (EOFError, KeyboardInterrupt):
+                print()
+                say("Exiting... Goodbye!", "bold green")
                 break
-            password = Prompt.ask("[bold yellow]Enter PIN[/bold yellow]", password=True).strip()
             if not atm.authenticate(username, password):
                 continue
-            console.print(Panel("[bold green]Login successful![/bold green]", expand=False))
+            panel("Login successful!", "bold green")
         
-        # Build a modern menu using Rich's Table
-        menu_table = Table(title="ATM Main Menu", show_header=False, header_style="bold magenta")
-        menu_table.add_column("Option", justify="center", style="cyan", no_wrap=True)
-        menu_table.add_column("Operation", style="magenta")
-        menu_table.add_row("1", "Check Balance")
-        menu_table.add_row("2", "Withdraw")
-        menu_table.add_row("3", "Deposit")
-        menu_table.add_row("4", "Transfer")
-        menu_table.add_row("5", "Transaction History")
-        menu_table.add_row("6", "Change PIN")
-        menu_table.add_row("7", "Simulate Interest Accrual")
-        menu_table.add_row("8", "Logout")
-        menu_table.add_row("9", "Exit")
-        console.print(menu_table)
+        show_menu()
 
         try:
-            choice = Prompt.ask("[bold yellow]Select option (1-9)[/bold yellow]").strip()
+            choice = ask("Select option (1-9)")
             if choice == "1":
                 balance = atm.check_balance()
-                console.print(f"[bold green]Current balance: Rp{balance:,}[/bold green]")
+                say(f"Current balance: Rp{balance:,}", "bold green")
             
             elif choice == "2":
-                amt_input = Prompt.ask("[bold yellow]Enter amount to withdraw[/bold yellow]").strip()
+                amt_input = ask("Enter amount to withdraw")
                 try:
-                    amount = Decimal(amt_input)
-                except (InvalidOperation, ValueError):
-                    console.print("[bold red]Invalid amount[/bold red]")
+                    amount = _parse_amount(amt_input)
+                except ValueError:
+                    say("Invalid amount", "bold red")
                     continue
                 success, message = atm.withdraw(amount)
-                console.print(f"[bold blue]{message}[/bold blue]")
+                say(message, "bold blue")
             
             elif choice == "3":
-                amt_input = Prompt.ask("[bold yellow]Enter amount to deposit[/bold yellow]").strip()
+                amt_input = ask("Enter amount to deposit")
                 try:
-                    amount = Decimal(amt_input)
-                except (InvalidOperation, ValueError):
-                    console.print("[bold red]Invalid amount[/bold red]")
+                    amount = _parse_amount(amt_input)
+                except ValueError:
+                    say("Invalid amount", "bold red")
                     continue
                 success, message = atm.deposit(amount)
-                console.print(f"[bold blue]{message}[/bold blue]")
+                say(message, "bold blue")
             
             elif choice == "4":
-                recipient = Prompt.ask("[bold yellow]Enter recipient username[/bold yellow]").strip()
-                amt_input = Prompt.ask("[bold yellow]Enter amount to transfer[/bold yellow]").strip()
+                recipient = ask("Enter recipient username")
+                amt_input = ask("Enter amount to transfer")
                 try:
-                    amount = Decimal(amt_input)
-                except (InvalidOperation, ValueError):
-                    console.print("[bold red]Invalid amount[/bold red]")
+                    amount = _parse_amount(amt_input)
+                except ValueError:
+                    say("Invalid amount", "bold red")
                     continue
                 success, message = atm.transfer(recipient, amount)
-                console.print(f"[bold blue]{message}[/bold blue]")
+                say(message, "bold blue")
             
             elif choice == "5":
-                history = atm.get_transaction_history()
-                if not history:
-                    console.print("[bold red]No transaction history available[/bold red]")
-                else:
-                    history_table = Table(title="Transaction History", show_header=True, header_style="bold magenta")
-                    history_table.add_column("Type", style="cyan")
-                    history_table.add_column("Amount", style="green")
-                    history_table.add_column("Balance After", style="green")
-                    history_table.add_column("Recipient", style="yellow")
-                    history_table.add_column("Timestamp", style="white")
-                    for t in history:
-                        recipient_text = t.get("recipient", "-")
-                        history_table.add_row(
-                            t["type"],
-                            f"Rp{Decimal(t['amount']):,}",
-                            f"Rp{Decimal(t['balance_after']):,}",
-                            recipient_text,
-                            t["timestamp"]
-                        )
+                history_table = None if args.fast else _new_history_table()
+                row_count = 0
+                for t in atm.get_transaction_history():
+                    row = (
+                        t["type"],
+                        f"Rp{int(t['amount']):,}",
+                        f"Rp{int(t['balance_after']):,}",
+                        t["recipient"] or "-",
+                        t["timestamp"]
+                    )
+                    if history_table is None:
+                        print(" | ".join(row))
+                    else:
+                        history_table.add_row(*row)
+                    row_count += 1
+                if row_count == 0:
+                    say("No transaction history available", "bold red")
+                elif history_table is not None:
                     console.print(history_table)
             
             elif choice == "6":
-                old_pin = Prompt.ask("[bold yellow]Enter your current PIN[/bold yellow]", password=True).strip()
-                new_pin = Prompt.ask("[bold yellow]Enter your new PIN[/bold yellow]", password=True).strip()
+                old_pin = ask("Enter your current PIN", password=True)
+                new_pin = ask("Enter your new PIN", password=True)
                 success, message = atm.change_pin(old_pin, new_pin)
-                console.print(f"[bold blue]{message}[/bold blue]")
+                say(message, "bold blue")
             
             elif choice == "7":
                 # Simulate a monthly interest accrual of 1%
-                success, message = atm.simulate_interest(Decimal("0.01"))
-                console.print(f"[bold blue]{message}[/bold blue]")
+                success, message = atm.simulate_interest(_DEFAULT_INTEREST_RATE)
+                say(message, "bold blue")
             
             elif choice == "8":
                 atm.logout()
-                console.print("[bold green]Logged out successfully[/bold green]")
+                say("Logged out successfully", "bold green")
             
             elif choice == "9":
-                console.print("[bold green]Exiting... Goodbye![/bold green]")
+                say("Exiting... Goodbye!", "bold green")
                 break
             
             else:
-                console.print("[bold red]Invalid option. Please select between 1 and 9.[/bold red]")
+                say("Invalid option. Please select between 1 and 9.", "bold red")
         
+        except (EOFError, KeyboardInterrupt):
+            print()
+            say("Exiting... Goodbye!", "bold green")
+            break
         except ValueError:
-            console.print("[bold red]Invalid input. Please try again.[/bold red]")
+            say("Invalid input. Please try again.", "bold red")
         except SecurityError as se:
-            console.print(f"[bold red]Security error: {se}[/bold red]")
+            say(f"Security error: {se}", "bold red")
         except Exception as e:
-            console.print(f"[bold red]An unexpected error occurred: {e}[/bold red]")
-            atm.logger.error(f"Unexpected error: {str(e)}")
+            say(f"An unexpected error occurred: {e}", "bold red")
+            atm.logger.error("Unexpected error: %s", e)
 
 
 if __name__ == "__main__":